@@ -3,13 +3,16 @@ import requests
 send_message_url = 'https://api.telegram.org/bot<token>/sendMessage'
 updates_url = 'https://api.telegram.org/bot<token>/getUpdates'
 
-token = open('private/bot_token').readline()
+with open('private/bot_token') as f:
+    token = f.readline().strip()
 send_message_url = send_message_url.replace('<token>', token)
 updates_url = updates_url.replace('<token>', token)
 
-chat_id = open('private/chat_id').readline()
+with open('private/chat_id') as f:
+    chat_id = f.readline()
 data = {"chat_id": int(chat_id), "text": "test message"}
 
-r = requests.post(send_message_url, data=data)
+with requests.Session() as session:
+    r = session.post(send_message_url, data=data, timeout=5)
 
 print(r.content)
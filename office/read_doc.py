@@ -1,11 +1,16 @@
-from docx import Document
+import zipfile
+import lxml.etree as ET
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
 
 
 def get_text(filename):
-    doc = Document(filename)
+    with zipfile.ZipFile(filename) as z:
+        with z.open("word/document.xml") as xml:
+            tree = ET.parse(xml)
     full_text = []
-    for para in doc.paragraphs:
-        full_text.append(para.text)
+    for para in tree.iter(W_NS + "p"):
+        full_text.append("".join(para.itertext()))
     return '\n'.join(full_text)
 
 
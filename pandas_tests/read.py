@@ -1,16 +1,25 @@
+import re
 import random
 import sqlite3
 import pandas as pd
 
-df = pd.read_excel("private/表格1.xlsx", index_col=0)
+TAG_RE = re.compile(r"<[^>]*>")
+
+df = pd.read_excel("private/表格1.xlsx", index_col=0, engine="calamine")
 print(df)
 
+classes = ["simulation", "hardware", "edge_computing"]
+
 cnx = sqlite3.connect("private/2-100.db")
-df1 = pd.read_sql("SELECT * FROM data", cnx)
-print(df1)
+first_chunk = True
+for chunk in pd.read_sql("SELECT * FROM data", cnx, chunksize=50000):
+    chunk["simple_content"] = chunk["content"].str.replace(TAG_RE, " ", regex=True)
+    chunk["label"] = random.choices(classes, k=len(chunk))
+    chunk.to_sql(name="data_tmp", con=cnx, index=False, if_exists='append')
+    chunk.to_csv("private/2-100.csv", index=False, mode='w' if first_chunk else 'a', header=first_chunk)
+    first_chunk = False
 
-df1["simple_content"] = df1["content"].str.replace("<.+?>", " ")
-classes = ["simulation", "hardware", "edge_computing"]
-df1["label"] = random.choices(classes, k=len(df1))
-df1.to_sql(name="data", con=cnx, index=False, if_exists='replace')
-df1.to_csv("private/2-100.csv", index=False)
+cnx.execute("DROP TABLE data")
+cnx.execute("ALTER TABLE data_tmp RENAME TO data")
+cnx.commit()
+cnx.close()
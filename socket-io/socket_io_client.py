@@ -1,12 +1,15 @@
 # -*- encoding:utf-8 -*-
 
-import json
+try:
+    import orjson as json
+except ImportError:
+    import json
 import socketio
 import logging
 
 logging.basicConfig()
-with open("private/socket-io.json", "r") as f:
-    socket_config = json.load(f)
+with open("private/socket-io.json", "rb") as f:
+    socket_config = json.loads(f.read())
 
 base_url = socket_config["url"]
 